@@ -22,8 +22,7 @@ def main():
 
     app_file = args.out
     app_path = os.path.dirname(app_file)
-    if not os.path.exists(app_path):
-        os.makedirs(app_path)
+    os.makedirs(app_path, exist_ok=True)
 
     # `dart` and `snapshot` are used in the output app script, use relative path
     # from script directory so it works from wherever it is invoked.
@@ -36,12 +35,16 @@ $SCRIPT_DIR/{rel_dart} \\
   $SCRIPT_DIR/{rel_snapshot} \\
   "$@"
 '''
-    with open(app_file, 'w') as file:
-        file.write(script_content)
     permissions = (
         stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR | stat.S_IRGRP |
         stat.S_IWGRP | stat.S_IXGRP | stat.S_IROTH)
-    os.chmod(app_file, permissions)
+    # Create the file with its final permissions so it never exists with the
+    # default mode. fchmod still applies them exactly, regardless of umask or
+    # a file left over from a previous build.
+    fd = os.open(app_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, permissions)
+    with os.fdopen(fd, 'w') as file:
+        os.fchmod(file.fileno(), permissions)
+        file.write(script_content)
 
 
 if __name__ == '__main__':
@@ -7,6 +7,7 @@ Updates the Fuchsia platform version.
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
 import re
@@ -82,16 +83,16 @@ def update_version_history(fuchsia_api_level):
         with open(VERSION_HISTORY_PATH, "r+") as f:
             version_history = json.load(f)
             versions = version_history['data']['versions']
-            if [version for version in versions
-                    if version['api_level'] == str(fuchsia_api_level)]:
+            api_levels = {version['api_level'] for version in versions}
+            abi_revisions = {version['abi_revision'] for version in versions}
+            if str(fuchsia_api_level) in api_levels:
                 print(
                     "error: Fuchsia API level {fuchsia_api_level} is already defined."
                     .format(fuchsia_api_level=fuchsia_api_level),
                     file=sys.stderr)
                 return False
             abi_revision = generate_random_abi_revision()
-            while [version for version in versions
-                   if version['abi_revision'] == abi_revision]:
+            while abi_revision in abi_revisions:
                 abi_revision = generate_random_abi_revision()
             versions.append(
                 {
@@ -149,16 +150,24 @@ def copy_compatibility_test_goldens(root_build_dir, fuchsia_api_level):
         root_build_dir, "compatibility_testing_goldens.json")
 
     with open(goldens_manifest) as f:
-        for entry in json.load(f):
+        entries = json.load(f)
+
+    success = True
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {}
+        for entry in entries:
             src = join_path(root_build_dir, entry["src"])
             dst = join_path(root_build_dir, entry["dst"])
+            print(f"copying {src} to {dst}")
+            futures[executor.submit(shutil.copyfile, src, dst)] = (src, dst)
+        for future in concurrent.futures.as_completed(futures):
+            src, dst = futures[future]
             try:
-                print(f"copying {src} to {dst}")
-                shutil.copyfile(src, dst)
+                future.result()
             except Exception as e:
                 print(f"failed to copy {src} to {dst}: {e}")
-                return False
-    return True
+                success = False
+    return success
 
 
 def join_path(root_dir, *paths):
@@ -157,6 +157,25 @@ class TestUpdatePlatformVersionMethods(unittest.TestCase):
                 self.test_dir, NEW_API_LEVEL))
         self.assertTrue(filecmp.cmp(self.fake_src_file, self.fake_dst_file))
 
+    def test_copy_compatibility_test_goldens_with_missing_src(self):
+        content = [
+            {
+                'dst': os.path.join(self.test_dst_dir, 'missing.test.json'),
+                'src': os.path.join(self.test_src_dir, 'missing.test.json'),
+            },
+            {
+                'dst': self.fake_dst_file,
+                'src': self.fake_src_file,
+            },
+        ]
+        with open(self.fake_golden_file, 'w') as f:
+            json.dump(content, f)
+
+        self.assertFalse(
+            update_platform_version.copy_compatibility_test_goldens(
+                self.test_dir, NEW_API_LEVEL))
+        self.assertTrue(filecmp.cmp(self.fake_src_file, self.fake_dst_file))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
 
+import concurrent.futures
 import os
 import subprocess
 import signal
@@ -19,6 +20,15 @@ FFX = './host_x64/ffx'
 ART_TEST_ZIP = '../../prebuilt/starnix/internal/android-image-amd64/art-run-test-target-data.zip'
 
 ART_TESTS = ['001-HelloWorld']
+ART_TEST_WORKERS = 4
+REMOTE_TEST_DIR = '/data/arttest'
+
+BOOT_CLASSPATH_JARS = (
+    'core-libart', 'apache-xml', 'okhttp', 'core-oj', 'service-art',
+    'bouncycastle', 'conscrypt')
+BOOT_CLASSPATH = '-Xbootclasspath:' + ':'.join(
+    [f'/apex/com.android.art/javalib/{jar}.jar' for jar in BOOT_CLASSPATH_JARS]
+    + ['/apex/com.android.i18n/javalib/core-icu4j.jar'])
 
 
 def run_bridge():
@@ -31,48 +41,28 @@ def adb_command(cmd):
     return adb + cmd
 
 
-def read_file(dir, file):
-    full_file = dir + '/' + file
-    with open(full_file, 'rb') as f:
-        contents = f.read()
-        return contents
-
-
 def connect_to_device():
-    connect_string = subprocess.check_output((ADB, "connect", DEVICE_NAME))
+    connect_string = subprocess.check_output(
+        (ADB, "connect", DEVICE_NAME), stdin=subprocess.DEVNULL)
     did_connect = connect_string.startswith(b'connected to')
     if not did_connect:
-        subprocess.call((ADB, 'disconnect', DEVICE_NAME))
+        subprocess.call(
+            (ADB, 'disconnect', DEVICE_NAME), stdin=subprocess.DEVNULL)
     return did_connect
 
 
-def extract_test_files(name):
-    tmppath = tempfile.mkdtemp()
+def extract_test_files(art_zip, name, path):
     jarfile = f'target/{name}/classes.jar'
-    refstdout = f'target/{name}/expected-stdout.txt'
-    refstderr = f'target/{name}/expected-stderr.txt'
-    with zipfile.ZipFile(ART_TEST_ZIP, 'r') as zip:
-        zip.extract(jarfile, path=tmppath)
-        zip.extract(refstdout, path=tmppath)
-        zip.extract(refstderr, path=tmppath)
-    return (tmppath, jarfile, refstdout, refstderr)
-
-
-def boot_classpath():
-    jars = (
-        'core-libart', 'apache-xml', 'okhttp', 'core-oj', 'service-art',
-        'bouncycastle', 'conscrypt')
-    boot_cp = '-Xbootclasspath'
-    for jar in jars:
-        boot_cp += f':/apex/com.android.art/javalib/{jar}.jar'
-    boot_cp += ':/apex/com.android.i18n/javalib/core-icu4j.jar'
-    return boot_cp
+    art_zip.extract(jarfile, path=path)
+    refout = art_zip.read(f'target/{name}/expected-stdout.txt')
+    referr = art_zip.read(f'target/{name}/expected-stderr.txt')
+    return (jarfile, refout, referr)
 
 
 class AdbTest(unittest.TestCase):
 
     def setUp(self):
-        subprocess.call((ADB, "kill-server"))
+        subprocess.call((ADB, "kill-server"), stdin=subprocess.DEVNULL)
         self.bridge = run_bridge()
         attempt_count = 0
         is_connected = False
@@ -88,39 +78,58 @@ class AdbTest(unittest.TestCase):
     def tearDown(self):
         os.killpg(os.getpgid(self.bridge.pid), signal.SIGTERM)
         self.bridge.wait()
-        subprocess.call((ADB, "kill-server"))
+        subprocess.call((ADB, "kill-server"), stdin=subprocess.DEVNULL)
 
     def test_basic(self):
         result = subprocess.check_output(
-            adb_command(("shell", "ls", "-l", "/system/bin/sh")))
+            adb_command(("shell", "ls", "-l", "/system/bin/sh")),
+            stdin=subprocess.DEVNULL)
         print(result)
 
+    def run_art_test(self, test, jarfile):
+        print(f'RUN_TEST: {test}')
+        remotejar = f'{REMOTE_TEST_DIR}/{jarfile}'
+        # Redirect stdin on the device too so that a test reading it sees EOF
+        # instead of blocking.
+        dalvik_command = adb_command(
+            (
+                'shell', 'dalvikvm64', BOOT_CLASSPATH, '-classpath', remotejar,
+                'Main', '</dev/null'))
+        return subprocess.run(
+            dalvik_command, stdin=subprocess.DEVNULL, capture_output=True)
+
     def test_art_java(self):
-        for test in ART_TESTS:
-            print(f'RUN_TEST: {test}')
-            try:
-                (tmppath, jarfile, refstdout,
-                 refstderr) = extract_test_files(test)
-                remotejar = f'/data/arttest/{test}.jar'
-                subprocess.call(
-                    adb_command(('push', tmppath + '/' + jarfile, remotejar)))
-
-                dalvik_command = adb_command(
-                    (
-                        'shell', 'dalvikvm64', boot_classpath(), '-classpath',
-                        remotejar, 'Main'))
-                result = subprocess.run(dalvik_command, capture_output=True)
-                refout = read_file(tmppath, refstdout)
-                referr = read_file(tmppath, refstderr)
-                obsout = result.stdout
-                if obsout is None:
-                    obsout = ''
-                obserr = result.stderr
-                if obserr is None:
-                    obserr = ''
-                self.assertEqual(obsout, refout)
-                self.assertEqual(obserr, referr)
-                subprocess.call(adb_command(('shell', 'rm', remotejar)))
-                print(f'PASSED: {test}')
-            finally:
-                shutil.rmtree(tmppath)
+        tmppath = tempfile.mkdtemp()
+        localdir = os.path.join(tmppath, os.path.basename(REMOTE_TEST_DIR))
+        try:
+            with zipfile.ZipFile(ART_TEST_ZIP, 'r') as art_zip:
+                test_files = [
+                    (test, extract_test_files(art_zip, test, localdir))
+                    for test in ART_TESTS
+                ]
+            subprocess.check_call(
+                adb_command(
+                    ('push', localdir, os.path.dirname(REMOTE_TEST_DIR))),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL)
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=ART_TEST_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.run_art_test, test, jarfile):
+                    (test, refout, referr)
+                    for (test, (jarfile, refout, referr)) in test_files
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    (test, refout, referr) = futures[future]
+                    result = future.result()
+                    status = f'{test} exited with status {result.returncode}'
+                    with self.subTest(test=test):
+                        self.assertEqual(result.stdout, refout, status)
+                        self.assertEqual(result.stderr, referr, status)
+                        print(f'PASSED: {test}')
+        finally:
+            subprocess.call(
+                adb_command(('shell', 'rm', '-rf', REMOTE_TEST_DIR)),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL)
+            shutil.rmtree(tmppath)